@@ -20,7 +20,9 @@ import tarfile
 import shutil
 import re
 import time
-from bpy.props import StringProperty, CollectionProperty, BoolProperty, IntProperty, PointerProperty
+import threading
+import struct
+from bpy.props import StringProperty, CollectionProperty, BoolProperty, IntProperty, PointerProperty, EnumProperty
 from bpy.types import Operator, Panel, PropertyGroup, AddonPreferences
 
 class MultiAudioImporterPreferences(AddonPreferences):
@@ -241,6 +243,150 @@ def run_ffmpeg_with_progress(command, timeout, duration_seconds=None, operation_
     except Exception as e:
         return None, str(e)
 
+# Custom properties on proxied sound strips holding the file names to switch between.
+# Only names are stored: both files share a directory, which is taken from the current
+# sound path so "Make Paths Relative" and "Find Missing Files" keep relinking working.
+FULL_QUALITY_FILE_PROP = "multi_audio_full_file"
+PROXY_FILE_PROP = "multi_audio_proxy_file"
+
+# Error returned by run_ffmpeg_to_buffer when the decoded audio outgrows the memory budget
+MEMORY_BUDGET_EXCEEDED = "memory_budget_exceeded"
+
+# Largest PCM payload a WAV file can describe (RIFF sizes are 32-bit, minus the rest of the header)
+MAX_WAV_DATA_BYTES = 0xFFFFFFFF - 36
+
+def run_ffmpeg_to_buffer(command, timeout, max_bytes):
+    """Run FFmpeg writing raw PCM to stdout and collect it in memory, aborting if it exceeds max_bytes"""
+    try:
+        # Send stderr to a temp file: damaged media can log an error per packet, and an unread
+        # stderr pipe would fill up and stall FFmpeg while we block reading stdout
+        with tempfile.TemporaryFile() as stderr_file:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file
+            )
+            
+            # Reads from stdout block, so a watchdog enforces the timeout by killing FFmpeg
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
+            
+            watchdog = threading.Timer(timeout, kill_on_timeout)
+            watchdog.start()
+            
+            try:
+                buffer = bytearray()
+                
+                while True:
+                    chunk = process.stdout.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    
+                    buffer.extend(chunk)
+                    if len(buffer) > max_bytes:
+                        process.kill()
+                        process.wait(timeout=5)
+                        return None, MEMORY_BUDGET_EXCEEDED
+                
+                process.wait()
+            finally:
+                watchdog.cancel()
+            
+            if timed_out.is_set():
+                return None, "Process timed out"
+            
+            if process.returncode == 0:
+                # Hand back the buffer itself; copying it would double the memory used
+                return buffer, None
+            
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace').strip()
+            return None, stderr or f"FFmpeg exited with code {process.returncode}"
+            
+    except Exception as e:
+        return None, str(e)
+
+def get_stream_channels(stream_info):
+    """Return the channel count ffprobe reported for a stream, or None if it is missing"""
+    try:
+        return int(stream_info.get("channels"))
+    except (TypeError, ValueError):
+        return None
+
+def build_channel_split_filter(stream_index, channels, with_proxies=False):
+    """Build an FFmpeg filter graph that splits one audio stream into mono outputs labelled [ch0], [ch1], ...
+
+    With with_proxies, every channel is also available as [ch0p], [ch1p], ... for a proxy output.
+    """
+    # pan works for any channel count, unlike channelsplit which needs a known channel layout
+    split_labels = "".join(f"[in{c}]" for c in range(channels))
+    filters = [f"[0:{stream_index}]asplit={channels}{split_labels}"]
+    for c in range(channels):
+        if with_proxies:
+            filters.append(f"[in{c}]pan=mono|c0=c{c},asplit=2[ch{c}][ch{c}p]")
+        else:
+            filters.append(f"[in{c}]pan=mono|c0=c{c}[ch{c}]")
+    return ";".join(filters)
+
+def split_interleaved_pcm(pcm_data, channels):
+    """Split interleaved 16-bit PCM into mono buffers, yielding one channel at a time to limit memory use"""
+    frame_bytes = channels * 2
+    usable_bytes = len(pcm_data) - len(pcm_data) % frame_bytes
+    # Slicing a 16-bit view copies sample bytes as-is, so this works regardless of host byte order
+    with memoryview(pcm_data) as view:
+        samples = view[:usable_bytes].cast('H')
+        for c in range(channels):
+            yield samples[c::channels].tobytes()
+        samples.release()
+
+def build_wav_header(data_size, sample_rate, channels, bits_per_sample=16):
+    """Build a 44-byte PCM WAV header for a raw sample buffer of data_size bytes"""
+    block_align = channels * bits_per_sample // 8
+    byte_rate = sample_rate * block_align
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample,
+        b'data', data_size
+    )
+
+def write_staging_wav(pcm_data, sample_rate, channels):
+    """Write a PCM buffer to a temporary WAV file and return its path"""
+    # Blender can only pack a sound from a file, so the buffer is staged in a short-lived temp file
+    fd, staging_path = tempfile.mkstemp(prefix="multi_audio_", suffix=".wav")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(build_wav_header(len(pcm_data), sample_rate, channels))
+            f.write(pcm_data)
+    except Exception:
+        os.remove(staging_path)
+        raise
+    return staging_path
+
+def new_packed_sound_strip(seq_editor, name, staging_path, channel, frame_start):
+    """Create a sound strip from a staged WAV file and pack its audio into the .blend"""
+    audio_strip = seq_editor.sequences.new_sound(
+        name=name,
+        filepath=staging_path,
+        channel=channel,
+        frame_start=frame_start
+    )
+    
+    try:
+        audio_strip.sound.pack()
+    except Exception:
+        # Don't leave a strip pointing at a staging file that is about to be deleted
+        seq_editor.sequences.remove(audio_strip)
+        raise
+    
+    # Point the sound at a virtual path so it reloads from the packed data, not the staging file.
+    # Sound names are unique across the .blend, so "Unpack All" never writes two sounds to one file.
+    audio_strip.sound.filepath = f"//{bpy.path.clean_name(audio_strip.sound.name)}.wav"
+    return audio_strip
+
 # Property group for each audio track (kept for compatibility)
 class AudioTrackItem(PropertyGroup):
     index: StringProperty(name="Index")
@@ -295,6 +441,16 @@ class SEQUENCER_PT_MultiAudioImport(Panel):
                 file_size_mb = os.path.getsize(source_file) / (1024 * 1024)
                 layout.label(text=f"Size: {file_size_mb:.1f} MB")
                 layout.separator()
+                
+                props = context.scene.multi_audio_props
+                layout.prop(props, "import_mode")
+                if props.import_mode == 'MEMORY':
+                    layout.prop(props, "memory_budget_mb")
+                layout.prop(props, "split_channels")
+                layout.prop(props, "write_proxies")
+                if props.write_proxies:
+                    layout.prop(props, "proxy_sample_rate")
+                
                 layout.operator("multi_audio.extract_additional_tracks", 
                               icon="SPEAKER", 
                               text="Extract Additional Audio Tracks")
@@ -304,6 +460,78 @@ class SEQUENCER_PT_MultiAudioImport(Panel):
                 layout.separator()
                 layout.label(text="Tip: Use 'Make Paths Relative'")
                 layout.label(text="or ensure source file exists")
+        
+        # Proxy switching applies to every MultiAudio metastrip, whatever is selected
+        layout.separator()
+        layout.label(text="Relink Audio Tracks:")
+        row = layout.row(align=True)
+        row.operator("multi_audio.relink_tracks", text="Full Quality").quality = 'FULL'
+        row.operator("multi_audio.relink_tracks", text="Proxies").quality = 'PROXY'
+
+def relink_multi_audio_strips(quality):
+    """Point proxied sound strips in all MultiAudio_* metastrips at their full-quality or proxy files
+
+    Returns (relinked, missing) counts.
+    """
+    file_prop = FULL_QUALITY_FILE_PROP if quality == 'FULL' else PROXY_FILE_PROP
+    relinked = 0
+    missing = 0
+    
+    for scene in bpy.data.scenes:
+        if not scene.sequence_editor:
+            continue
+        
+        for meta_strip in scene.sequence_editor.sequences_all:
+            if meta_strip.type != 'META' or not meta_strip.name.startswith("MultiAudio_"):
+                continue
+            
+            for strip in meta_strip.sequences:
+                if strip.type != 'SOUND' or file_prop not in strip:
+                    continue
+                
+                # Resolve against the current directory, keeping the path relative if the user made it so
+                target_path = os.path.join(os.path.dirname(strip.sound.filepath), strip[file_prop])
+                if not os.path.isfile(bpy.path.abspath(target_path)):
+                    print(f"Multi-Audio: cannot relink {strip.name}, file not found: {target_path}")
+                    missing += 1
+                    continue
+                
+                if strip.sound.filepath != target_path:
+                    # Setting the path reloads the sound datablock from the new file
+                    strip.sound.filepath = target_path
+                relinked += 1
+    
+    return relinked, missing
+
+class AUDIO_OT_RelinkTracks(Operator):
+    bl_idname = "multi_audio.relink_tracks"
+    bl_label = "Relink Audio Tracks"
+    bl_description = "Switch the audio strips in all MultiAudio metastrips between their full-quality files and their proxies"
+
+    quality: EnumProperty(
+        name="Quality",
+        items=[
+            ('FULL', "Full Quality", "Use the full-rate extracted audio (for the final mixdown)"),
+            ('PROXY', "Proxies", "Use the low-rate proxies (for editing)"),
+        ],
+        default='FULL'
+    )
+
+    def execute(self, context):
+        relinked, missing = relink_multi_audio_strips(self.quality)
+        
+        if missing and self.quality == 'FULL':
+            # Fail loudly so a pre-render script stops instead of mixing down from proxies
+            self.report({'ERROR'}, f"{missing} full-quality audio files not found, those strips are still on proxies. Check console for details.")
+            return {'CANCELLED'}
+        elif missing:
+            self.report({'WARNING'}, f"Relinked {relinked} audio strips, {missing} files not found. Check console for details.")
+        elif relinked:
+            self.report({'INFO'}, f"Relinked {relinked} audio strips to {'full quality' if self.quality == 'FULL' else 'proxies'}")
+        else:
+            self.report({'INFO'}, "No proxied MultiAudio strips found")
+        
+        return {'FINISHED'}
 
 # Main extract operator
 class AUDIO_OT_ExtractAdditionalTracks(Operator):
@@ -359,11 +587,17 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                 return {'CANCELLED'}
             
             found_audio_streams = found_audio_info
+            props = context.scene.multi_audio_props
+            
+            additional_tracks = found_audio_streams[1:]  # Skip first track (will be included with original strip)
+            if props.split_channels and found_audio_streams and (get_stream_channels(found_audio_streams[0]) or 0) > 1:
+                # The original strip only carries the first stream as a mixdown, so split it into per-channel strips too
+                additional_tracks = found_audio_streams[:1] + additional_tracks
             
             if not found_audio_streams:
                 self.report({'INFO'}, "No audio tracks found in source file.")
                 return {'FINISHED'}
-            elif len(found_audio_streams) <= 1:
+            elif not additional_tracks:
                 self.report({'INFO'}, f"Only {len(found_audio_streams)} audio track found. No additional tracks to extract.")
                 return {'FINISHED'}
             else:
@@ -459,11 +693,12 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
             
             self.report({'INFO'}, f"Original strip properties: start={original_frame_start}, final_start={original_frame_final_start}, final_end={original_frame_final_end}, duration={original_frame_final_duration}")
             
-            # If we have multiple audio tracks, extract them safely
-            if len(found_audio_streams) > 1:
-                self.report({'INFO'}, f"Extracting all {len(found_audio_streams)} audio tracks safely...")
-                
-                additional_tracks = found_audio_streams[1:]  # Skip first track (will be included with original strip)
+            # If we have additional audio tracks, extract them safely
+            if additional_tracks:
+                self.report({'INFO'}, f"Extracting {len(additional_tracks)} of {len(found_audio_streams)} audio tracks safely...")
+                if props.split_channels:
+                    planned_splits = sum(1 for s in additional_tracks if (get_stream_channels(s) or 0) > 1)
+                    self.report({'INFO'}, f"{planned_splits} multichannel tracks will be split into per-channel mono strips")
                 
                 audio_timeout = max(60, min(600, int(file_size_mb * 2)))
                 
@@ -484,6 +719,8 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                     self.report({'INFO'}, f"No existing channels found, starting extraction at channel {extraction_start_channel}")
                 
                 created_audio_strips = []  # Track all strips we create
+                extracted_stream_count = 0  # Streams that produced at least one strip
+                split_stream_count = 0  # Of those, streams split into per-channel strips
                 next_channel = extraction_start_channel
 
                 # Phase 4: Extract and add additional audio tracks to main timeline (30-80% of progress)
@@ -498,6 +735,9 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                     stream_lang_tags = stream_info.get("tags", {})
                     stream_lang = stream_lang_tags.get("language", f"Track_{stream_index}")
                     stream_codec = stream_info.get("codec_name", "unknown")
+                    stream_channels = get_stream_channels(stream_info)
+                    # Only split when ffprobe actually reported the channel count
+                    split_channels = props.split_channels and stream_channels is not None and stream_channels > 1
 
                     # Use WAV format for universal compatibility instead of AAC
                     temp_audio_filename = f"additional_audio_{original_strip_name}_track_{stream_index}.wav"
@@ -507,6 +747,8 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                     
                     self.report({'INFO'}, f"Extracting additional audio track {stream_index} ({stream_lang}, {stream_codec}) [{i+1}/{len(additional_tracks)}]...")
                     
+                    track_strips = []
+                    
                     try:
                         ffmpeg_exe = get_executable_path("ffmpeg")
                         
@@ -521,93 +763,221 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                         self.report({'INFO'}, f"Strip offsets: frame_offset_start={original_frame_offset_start}, frame_offset_end={original_frame_offset_end}")
                         self.report({'INFO'}, f"Using precise extraction: start={strip_start_offset_seconds:.3f}s, duration={precise_duration_seconds:.3f}s ({original_frame_final_duration} frames at {actual_video_fps:.2f} FPS)")
                         
-                        # Extract audio track and convert to WAV PCM for universal compatibility
-                        ffmpeg_command = [
-                            ffmpeg_exe, "-y", 
-                            "-ss", f"{strip_start_offset_seconds:.6f}",  # Seek BEFORE input for accuracy
-                            "-i", source_file,
-                            "-map", f"0:{stream_index}", 
-                            "-vn",  # No video output
-                            "-acodec", "pcm_s16le",  # Convert to 16-bit PCM for WAV compatibility
-                            "-ar", "48000",  # Standard sample rate
-                            temp_path
-                        ]
-                        
-                        # Debug: Show the exact FFmpeg command
-                        cmd_str = ' '.join(ffmpeg_command)
-                        self.report({'INFO'}, f"FFmpeg command: {cmd_str}")
+                        audio_strip_name = f"Audio_{stream_lang}"
                         
-                        stdout, stderr = run_ffmpeg_with_progress(
-                            ffmpeg_command, 
-                            audio_timeout, 
-                            precise_duration_seconds, 
-                            f"Additional Audio Track {i+1}"
-                        )
+                        # One strip per channel when splitting, otherwise one strip for the whole stream
+                        if split_channels:
+                            self.report({'INFO'}, f"Splitting track {stream_index} into {stream_channels} mono strips in a single pass")
+                            output_names = [f"{audio_strip_name}_ch{c + 1}" for c in range(stream_channels)]
+                        else:
+                            output_names = [audio_strip_name]
                         
-                        if stderr:
-                            self.report({'WARNING'}, f"Failed to extract audio track {stream_index}: {stderr}")
-                            continue
-
-                        # Check the extracted file properties for debugging
-                        if os.path.exists(temp_path):
-                            file_size_kb = os.path.getsize(temp_path) / 1024
-                            self.report({'INFO'}, f"Extracted audio file: {file_size_kb:.1f} KB")
+                        if props.import_mode == 'MEMORY':
+                            # Decode to stereo when ffprobe didn't report a channel count
+                            decode_channels = stream_channels or 2
                             
-                            # Verify extracted file duration with ffprobe for debugging
-                            try:
-                                verify_command = [
-                                    ffprobe_exe, "-v", "error", 
-                                    "-show_entries", "format=duration",
-                                    "-of", "default=noprint_wrappers=1:nokey=1", temp_path
+                            # Estimate the decoded size up front so long sources go straight to files
+                            remaining_seconds = max(video_duration_seconds - strip_start_offset_seconds, 0)
+                            estimated_bytes = int(remaining_seconds * 48000 * decode_channels * 2)
+                            # Stay below the WAV size limit so oversized tracks fall back to files instead of failing
+                            memory_budget_bytes = min(props.memory_budget_mb * 1024 * 1024, MAX_WAV_DATA_BYTES)
+                            
+                            if estimated_bytes > memory_budget_bytes:
+                                self.report({'INFO'}, f"Track {stream_index} needs ~{estimated_bytes / (1024 * 1024):.1f} MB, over the {props.memory_budget_mb} MB memory budget - writing a WAV file instead")
+                            else:
+                                # Decode straight to raw PCM on stdout instead of a WAV file on disk
+                                ffmpeg_command = [
+                                    ffmpeg_exe, "-v", "error", "-nostats",
+                                    "-ss", f"{strip_start_offset_seconds:.6f}",
+                                    "-i", source_file,
+                                    "-map", f"0:{stream_index}",
+                                    "-vn",
+                                    "-acodec", "pcm_s16le",
+                                    "-ar", "48000",
+                                    "-ac", str(decode_channels),
+                                    "-f", "s16le", "pipe:1"
                                 ]
-                                verify_result = subprocess.run(verify_command, capture_output=True, text=True, check=False, timeout=10)
                                 
-                                if verify_result.returncode == 0 and verify_result.stdout.strip():
-                                    actual_extracted_duration = float(verify_result.stdout.strip())
-                                    self.report({'INFO'}, f"Verified extracted file duration: {actual_extracted_duration:.3f}s (requested: {precise_duration_seconds:.3f}s)")
+                                cmd_str = ' '.join(ffmpeg_command)
+                                self.report({'INFO'}, f"FFmpeg command: {cmd_str}")
+                                
+                                pcm_data, stderr = run_ffmpeg_to_buffer(ffmpeg_command, audio_timeout, memory_budget_bytes)
+                                
+                                if stderr == MEMORY_BUDGET_EXCEEDED:
+                                    self.report({'INFO'}, f"Track {stream_index} outgrew the {props.memory_budget_mb} MB memory budget - writing a WAV file instead")
+                                elif stderr:
+                                    self.report({'WARNING'}, f"In-memory extraction of track {stream_index} failed, writing a WAV file instead: {stderr}")
                                 else:
-                                    self.report({'WARNING'}, f"Could not verify extracted file duration")
-                            except Exception as e:
-                                self.report({'WARNING'}, f"Error verifying extracted file: {e}")
+                                    self.report({'INFO'}, f"Decoded {len(pcm_data) / 1024:.1f} KB of audio in memory")
+                                    
+                                    staging_paths = []
+                                    try:
+                                        # The interleaved buffer already holds every channel, so splitting needs no extra decode
+                                        if split_channels:
+                                            for pcm_buffer in split_interleaved_pcm(pcm_data, stream_channels):
+                                                staging_paths.append(write_staging_wav(pcm_buffer, 48000, 1))
+                                                del pcm_buffer
+                                        else:
+                                            staging_paths.append(write_staging_wav(pcm_data, 48000, decode_channels))
+                                        
+                                        # Release the decoded audio before Blender loads its own copy while packing
+                                        del pcm_data
+                                        
+                                        for output_name, staging_path in zip(output_names, staging_paths):
+                                            track_strips.append(new_packed_sound_strip(
+                                                seq_editor, output_name, staging_path,
+                                                next_channel + len(track_strips), temp_extraction_start
+                                            ))
+                                    finally:
+                                        for staging_path in staging_paths:
+                                            if os.path.exists(staging_path):
+                                                os.remove(staging_path)
+                        
+                        if not track_strips:
+                            if split_channels:
+                                # Decode once and route each channel of the stream to its own mono WAV
+                                output_paths = [
+                                    os.path.join(source_dir, f"additional_audio_{original_strip_name}_track_{stream_index}_ch{c + 1}.wav")
+                                    for c in range(stream_channels)
+                                ]
+                                ffmpeg_command = [
+                                    ffmpeg_exe, "-y",
+                                    "-ss", f"{strip_start_offset_seconds:.6f}",  # Seek BEFORE input for accuracy
+                                    "-i", source_file,
+                                    "-filter_complex", build_channel_split_filter(stream_index, stream_channels, props.write_proxies)
+                                ]
+                                for c, output_path in enumerate(output_paths):
+                                    ffmpeg_command += [
+                                        "-map", f"[ch{c}]",
+                                        "-acodec", "pcm_s16le",
+                                        "-ar", "48000",
+                                        output_path
+                                    ]
+                            else:
+                                output_paths = [temp_path]
+                                # Extract audio track and convert to WAV PCM for universal compatibility
+                                ffmpeg_command = [
+                                    ffmpeg_exe, "-y", 
+                                    "-ss", f"{strip_start_offset_seconds:.6f}",  # Seek BEFORE input for accuracy
+                                    "-i", source_file,
+                                    "-map", f"0:{stream_index}", 
+                                    "-vn",  # No video output
+                                    "-acodec", "pcm_s16le",  # Convert to 16-bit PCM for WAV compatibility
+                                    "-ar", "48000",  # Standard sample rate
+                                    temp_path
+                                ]
                             
-                            # Special warning for very small files (likely silent/empty tracks)
-                            if file_size_kb < 10:  # Less than 10KB is suspiciously small for real audio
-                                self.report({'WARNING'}, f"Track {stream_index} ({stream_lang}) extracted file is very small ({file_size_kb:.1f} KB)")
-                                self.report({'WARNING'}, f"This track may be silent/empty but will still be included in the metastrip")
-                        else:
-                            self.report({'WARNING'}, f"Extracted audio file not found: {temp_path}")
-                            continue
-
-                        # Import the extracted audio to safe area on timeline
-                        audio_strip_name = f"Audio_{stream_lang}"
+                            proxy_paths = []
+                            if props.write_proxies:
+                                # Write low-rate mono proxies from the same decode for lighter scrubbing and playback
+                                proxy_paths = [os.path.splitext(output_path)[0] + "_proxy.wav" for output_path in output_paths]
+                                if split_channels:
+                                    proxy_maps = [f"[ch{c}p]" for c in range(stream_channels)]
+                                else:
+                                    proxy_maps = [f"0:{stream_index}"]
+                                for proxy_map, proxy_path in zip(proxy_maps, proxy_paths):
+                                    ffmpeg_command += [
+                                        "-map", proxy_map,
+                                        "-acodec", "pcm_s16le",
+                                        "-ar", str(props.proxy_sample_rate),
+                                        "-ac", "1",
+                                        proxy_path
+                                    ]
                         
-                        # Create the sound strip in safe extraction area  
-                        audio_strip = seq_editor.sequences.new_sound(
-                            name=audio_strip_name,
-                            filepath=temp_path,
-                            channel=next_channel,
-                            frame_start=temp_extraction_start  # Place in temporary area
-                        )
+                            # Debug: Show the exact FFmpeg command
+                            cmd_str = ' '.join(ffmpeg_command)
+                            self.report({'INFO'}, f"FFmpeg command: {cmd_str}")
+                        
+                            stdout, stderr = run_ffmpeg_with_progress(
+                                ffmpeg_command, 
+                                audio_timeout, 
+                                precise_duration_seconds, 
+                                f"Additional Audio Track {i+1}"
+                            )
+                        
+                            if stderr:
+                                self.report({'WARNING'}, f"Failed to extract audio track {stream_index}: {stderr}")
+                                continue
+
+                            for k, (output_name, output_path) in enumerate(zip(output_names, output_paths)):
+                                # Check the extracted file properties for debugging
+                                if os.path.exists(output_path):
+                                    file_size_kb = os.path.getsize(output_path) / 1024
+                                    self.report({'INFO'}, f"Extracted audio file: {file_size_kb:.1f} KB")
+                                
+                                    # Verify extracted file duration with ffprobe for debugging
+                                    try:
+                                        verify_command = [
+                                            ffprobe_exe, "-v", "error", 
+                                            "-show_entries", "format=duration",
+                                            "-of", "default=noprint_wrappers=1:nokey=1", output_path
+                                        ]
+                                        verify_result = subprocess.run(verify_command, capture_output=True, text=True, check=False, timeout=10)
+                                    
+                                        if verify_result.returncode == 0 and verify_result.stdout.strip():
+                                            actual_extracted_duration = float(verify_result.stdout.strip())
+                                            self.report({'INFO'}, f"Verified extracted file duration: {actual_extracted_duration:.3f}s (requested: {precise_duration_seconds:.3f}s)")
+                                        else:
+                                            self.report({'WARNING'}, f"Could not verify extracted file duration")
+                                    except Exception as e:
+                                        self.report({'WARNING'}, f"Error verifying extracted file: {e}")
+                                
+                                    # Special warning for very small files (likely silent/empty tracks)
+                                    if file_size_kb < 10:  # Less than 10KB is suspiciously small for real audio
+                                        self.report({'WARNING'}, f"Track {stream_index} ({output_name}) extracted file is very small ({file_size_kb:.1f} KB)")
+                                        self.report({'WARNING'}, f"This track may be silent/empty but will still be included in the metastrip")
+                                else:
+                                    self.report({'WARNING'}, f"Extracted audio file not found: {output_path}")
+                                    continue
+
+                                # Edit against the proxy when one was written; relinking swaps in the full-quality file
+                                proxy_path = proxy_paths[k] if proxy_paths else None
+                                if proxy_path and not os.path.exists(proxy_path):
+                                    self.report({'WARNING'}, f"Proxy file not found, using full-quality audio: {proxy_path}")
+                                    proxy_path = None
+
+                                # Import the extracted audio to safe area on timeline
+                                # Create the sound strip in safe extraction area  
+                                audio_strip = seq_editor.sequences.new_sound(
+                                    name=output_name,
+                                    filepath=proxy_path or output_path,
+                                    channel=next_channel + len(track_strips),
+                                    frame_start=temp_extraction_start  # Place in temporary area
+                                )
+                                if audio_strip:
+                                    if proxy_path:
+                                        audio_strip[FULL_QUALITY_FILE_PROP] = os.path.basename(output_path)
+                                        audio_strip[PROXY_FILE_PROP] = os.path.basename(proxy_path)
+                                    track_strips.append(audio_strip)
+                                else:
+                                    self.report({'WARNING'}, f"Failed to create audio strip {output_name}")
                         
-                        # Verify the strip was created
-                        if audio_strip:
-                            self.report({'INFO'}, f"Created {audio_strip_name}: start={audio_strip.frame_start}, final_start={audio_strip.frame_final_start}, final_end={audio_strip.frame_final_end}, duration={audio_strip.frame_final_duration}")
+                        # Verify the strips were created
+                        for audio_strip in track_strips:
+                            self.report({'INFO'}, f"Created {audio_strip.name}: start={audio_strip.frame_start}, final_start={audio_strip.frame_final_start}, final_end={audio_strip.frame_final_end}, duration={audio_strip.frame_final_duration}")
                                 
                             created_audio_strips.append(audio_strip)
-                            self.report({'INFO'}, f"✓ Added {audio_strip_name} on channel {audio_strip.channel} (natural duration: {audio_strip.frame_final_duration} frames)")
+                            self.report({'INFO'}, f"✓ Added {audio_strip.name} on channel {audio_strip.channel} (natural duration: {audio_strip.frame_final_duration} frames)")
                             next_channel += 1
-                        else:
-                            self.report({'WARNING'}, f"Failed to create audio strip {audio_strip_name}")
+                        
+                        if track_strips:
+                            extracted_stream_count += 1
+                            if split_channels:
+                                split_stream_count += 1
                     
                     except Exception as e:
                         self.report({'WARNING'}, f"Failed to import audio track {stream_index}: {e}")
+                        # Remove strips already created for this track so nothing is left behind at the temporary area
+                        for audio_strip in track_strips:
+                            if audio_strip not in created_audio_strips:
+                                seq_editor.sequences.remove(audio_strip)
                         continue
                 
                 # Phase 5: Create metastrip from all tracks (80-100% of progress)
                 wm.progress_update(90)
                 
                 if created_audio_strips:
-                    self.report({'INFO'}, f"Creating metastrip from original strip + {len(created_audio_strips)} additional audio tracks...")
+                    self.report({'INFO'}, f"Creating metastrip from original strip + {len(created_audio_strips)} audio strips...")
                     
                     # First, move original strip to temporary area to group with audio tracks
                     original_strip_temp_start = temp_extraction_start
@@ -657,9 +1027,11 @@ class AUDIO_OT_ExtractAdditionalTracks(Operator):
                                 self.report({'WARNING'}, f"Could not fully restore duration: {duration_error}")
                         
                         self.report({'INFO'}, f"✓ Successfully created metastrip '{meta_strip.name}' containing:")
-                        self.report({'INFO'}, f"  - 1 video track")  
-                        self.report({'INFO'}, f"  - {len(created_audio_strips) + 1} audio tracks")
-                        self.report({'INFO'}, f"✓ All {len(found_audio_streams)} audio tracks successfully grouped!")
+                        self.report({'INFO'}, f"  - 1 original strip")  
+                        self.report({'INFO'}, f"  - {len(created_audio_strips)} extracted audio strips")
+                        if split_stream_count:
+                            self.report({'INFO'}, f"✓ Split {split_stream_count} multichannel tracks into per-channel mono strips")
+                        self.report({'INFO'}, f"✓ {len(created_audio_strips)} audio strips from {extracted_stream_count} of {len(found_audio_streams)} audio tracks successfully grouped!")
                         self.report({'INFO'}, f"✓ Original position and properties preserved!")
                         self.report({'INFO'}, f"✓ Timeline safety maintained - no existing content disturbed!")
                         self.report({'INFO'}, f"✓ Using efficient PCM compression (much smaller files)!")
@@ -691,6 +1063,39 @@ class MultiAudioProperties(PropertyGroup):
     )
     tracks: CollectionProperty(type=AudioTrackItem)  # Kept for compatibility
     track_index: IntProperty()
+    import_mode: EnumProperty(
+        name="Import Mode",
+        description="How extracted audio is brought into Blender",
+        items=[
+            ('FILE', "WAV Files", "Write each track as a WAV file next to the source video"),
+            ('MEMORY', "Packed (In-Memory)", "Decode each track into memory and pack it into the .blend, falling back to WAV files for tracks over the memory budget"),
+        ],
+        default='FILE'
+    )
+    memory_budget_mb: IntProperty(
+        name="Memory Budget (MB)",
+        description="Largest decoded track buffered in memory before packing (splitting channels briefly needs one extra channel's worth); bigger tracks are written to WAV files instead",
+        default=256,
+        min=16,
+        max=4000
+    )
+    split_channels: BoolProperty(
+        name="Split Channels",
+        description="Import every channel of multichannel streams as its own mono strip, decoding each stream only once",
+        default=False
+    )
+    write_proxies: BoolProperty(
+        name="Write Proxies",
+        description="Also write low-rate mono proxies of WAV-file tracks in the same pass and edit against them. Packed tracks get no proxies",
+        default=False
+    )
+    proxy_sample_rate: IntProperty(
+        name="Proxy Sample Rate",
+        description="Sample rate of the proxy files",
+        default=16000,
+        min=8000,
+        max=48000
+    )
 
 # Register/unregister
 classes = (
@@ -699,6 +1104,7 @@ classes = (
     AudioTrackItem,
     SEQUENCER_PT_MultiAudioImport,
     AUDIO_OT_ExtractAdditionalTracks,
+    AUDIO_OT_RelinkTracks,
     MultiAudioProperties,
 )
 